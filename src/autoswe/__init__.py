@@ -1,5 +1,18 @@
 """Auto-SWE: Structured output wrapper for Claude Agent SDK."""
 
-from autoswe.structured import structured_query, structured_query_stream
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from autoswe.structured import structured_query, structured_query_stream
 
 __all__ = ["structured_query", "structured_query_stream"]
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first use: importing the SDK is slow and the CLI only needs it
+    # once a command actually runs.
+    if name in __all__:
+        from autoswe import structured
+
+        return getattr(structured, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
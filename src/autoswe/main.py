@@ -1,13 +1,8 @@
 """CLI entry point for autoswe."""
 
-from functools import partial
-
 import typer
-from asyncer import syncify
-from pydantic import BaseModel, Field
 
-from autoswe import permission, refactor, review
-from autoswe.structured import structured_query
+from autoswe import permission, refactor, review, runner
 
 app = typer.Typer()
 app.add_typer(permission.app, name="permission")
@@ -15,10 +10,10 @@ app.add_typer(refactor.app, name="refactor")
 app.add_typer(review.app, name="review")
 
 
-@app.command()
-@partial(syncify, raise_sync_error=False)
-async def main() -> None:
-    """Example usage of structured_query."""
+async def _main() -> None:
+    from pydantic import BaseModel, Field
+
+    from autoswe.structured import structured_query
 
     class CompanyInfo(BaseModel):
         """Information about a company."""
@@ -39,6 +34,12 @@ async def main() -> None:
     print(f"Products: {', '.join(result.key_products)}")
 
 
+@app.command()
+def main() -> None:
+    """Example usage of structured_query."""
+    runner.run(_main())
+
+
 def cli() -> None:
     """CLI entry point."""
     app()
@@ -1,23 +1,18 @@
 """Permission checking command for autoswe."""
 
-from functools import partial
-
 import typer
-from asyncer import syncify
-from claude_agent_sdk import query
-from claude_agent_sdk.types import ClaudeAgentOptions
-from rich.console import Console
 
-from autoswe.streaming import print_message
+from autoswe import runner
 
 app = typer.Typer()
-console = Console()
 
 
-@app.command()
-@partial(syncify, raise_sync_error=False)
-async def check() -> None:
-    """Check available tool permissions by executing a test query."""
+async def _check() -> None:
+    from claude_agent_sdk import query
+    from claude_agent_sdk.types import ClaudeAgentOptions
+
+    from autoswe.streaming import console, print_message
+
     options = ClaudeAgentOptions(
         permission_mode="acceptEdits",
         setting_sources=["user", "project", "local"],
@@ -52,6 +47,12 @@ Be thorough - test every tool you can find."""
     console.print()
 
 
+@app.command()
+def check() -> None:
+    """Check available tool permissions by executing a test query."""
+    runner.run(_check())
+
+
 def cli() -> None:
     """CLI entry point."""
     app()
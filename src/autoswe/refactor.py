@@ -1,40 +1,53 @@
 """Autorefactor command - runs Claude Code in a loop to perform refactoring."""
 
-from functools import partial
-
 import typer
-from asyncer import syncify
-from claude_agent_sdk import query
-from rich.console import Console
-from rich.rule import Rule
 
-from autoswe.streaming import print_message
+from autoswe import runner
 
 app = typer.Typer()
-console = Console()
 
 REFACTOR_PROMPT = """Analyze the project code to find a precise/targeted/elegant refactoring objective. You must analyze existing local branches and pick an objective that is not a duplicate. Perform the refactor. Use `gt create <branchname> -m ...` to create a commit. When you cannot find any refactoring objectives, output '<promise>NO REFACTORING NEEDED</promise>'"""
 
 NO_REFACTORING_MARKER = "<promise>NO REFACTORING NEEDED</promise>"
 
 
-async def run_claude_code(prompt: str) -> str:
-    """Run Claude Code SDK with rich streaming output, return full text."""
-    output: list[str] = []
+async def run_claude_code(prompt: str, marker: str) -> bool:
+    """Run Claude Code SDK with rich streaming output.
+
+    Returns whether marker appeared in the text output. Only a tail of the
+    output is kept, so memory use does not grow with the length of the run.
+    """
+    from claude_agent_sdk import query
+
+    from autoswe.streaming import console, print_message
+
+    chunks: list[str] = []
+    # A marker split across chunks ends in the next chunk, so only the last
+    # len(marker) - 1 characters need to be carried over.
+    keep = len(marker) - 1
+    tail = ""
+    marker_seen = False
 
     async for message in query(prompt=prompt):
-        print_message(message, output=output)
+        print_message(message, output=chunks)
+        if not marker_seen:
+            for chunk in chunks:
+                window = tail + chunk
+                if marker in window:
+                    marker_seen = True
+                    break
+                tail = window[max(len(window) - keep, 0) :]
+        chunks.clear()
 
     console.print()
-    return "".join(output)
+    return marker_seen
 
 
-@app.callback(invoke_without_command=True)
-@partial(syncify, raise_sync_error=False)
-async def autorefactor(
-    max_iterations: int = typer.Option(20, "--max", "-m", help="Maximum iterations"),
-) -> None:
-    """Run Claude Code to find and perform refactoring until none needed."""
+async def _autorefactor(max_iterations: int) -> None:
+    from rich.rule import Rule
+
+    from autoswe.streaming import console
+
     for i in range(max_iterations):
         console.print()
         console.print(
@@ -42,9 +55,7 @@ async def autorefactor(
         )
         console.print()
 
-        output = await run_claude_code(REFACTOR_PROMPT)
-
-        if NO_REFACTORING_MARKER in output:
+        if await run_claude_code(REFACTOR_PROMPT, NO_REFACTORING_MARKER):
             console.print()
             console.print(
                 "[bold green]✨ No more refactoring needed. Done![/bold green]"
@@ -58,3 +69,11 @@ async def autorefactor(
     console.print(
         f"[bold yellow]Reached max iterations ({max_iterations})[/bold yellow]"
     )
+
+
+@app.callback(invoke_without_command=True)
+def autorefactor(
+    max_iterations: int = typer.Option(20, "--max", "-m", help="Maximum iterations"),
+) -> None:
+    """Run Claude Code to find and perform refactoring until none needed."""
+    runner.run(_autorefactor(max_iterations))
@@ -1,17 +1,18 @@
 """Review command for requesting codex reviews on PRs."""
 
 import asyncio
-import json
-from functools import partial
+from typing import Any
 
+import orjson
 import typer
-from asyncer import syncify
+
+from autoswe import runner
 
 app = typer.Typer()
 
 
-async def run_gh_command(*args: str) -> str:
-    """Run a gh CLI command and return stdout."""
+async def run_gh_command(*args: str) -> bytes:
+    """Run a gh CLI command and return raw stdout."""
     proc = await asyncio.create_subprocess_exec(
         "gh",
         *args,
@@ -21,32 +22,69 @@ async def run_gh_command(*args: str) -> str:
     stdout, stderr = await proc.communicate()
     if proc.returncode != 0:
         raise RuntimeError(f"gh command failed: {stderr.decode()}")
-    return stdout.decode()
-
-
-async def get_review_requested_prs(repo: str | None = None) -> list[dict]:
-    """Get PRs where the current user is requested as a reviewer."""
-    args = [
-        "pr",
-        "list",
-        "--json",
-        "number,url,title",
-        "--search",
-        "review-requested:@me",
-    ]
-    if repo:
-        args.extend(["--repo", repo])
-    output = await run_gh_command(*args)
-    return json.loads(output) if output.strip() else []
+    return stdout
 
 
-async def get_pr_details(pr_number: int, repo: str | None = None) -> dict:
-    """Get PR details including comments and commits."""
-    args = ["pr", "view", str(pr_number), "--json", "comments,commits"]
-    if repo:
-        args.extend(["--repo", repo])
+async def run_gh_json(*args: str) -> Any:
+    """Run a gh CLI command and return its parsed JSON output, or None if empty."""
     output = await run_gh_command(*args)
-    return json.loads(output) if output.strip() else {}
+    return orjson.loads(output) if output.strip() else None
+
+
+REVIEW_REQUESTED_PRS_QUERY = """
+query($searchQuery: String!) {
+  viewer { login }
+  search(query: $searchQuery, type: ISSUE, first: 50) {
+    nodes {
+      ... on PullRequest {
+        number
+        url
+        title
+        comments(last: 100) { nodes { author { login } body createdAt } }
+        commits(last: 50) { nodes { commit { committedDate } } }
+      }
+    }
+  }
+}
+"""
+
+
+async def get_review_requested_prs(
+    repo: str | None = None,
+) -> tuple[str | None, list[dict]]:
+    """Get PRs where the current user is requested as a reviewer.
+
+    Comments and commits are fetched in the same GraphQL query, so the
+    returned dicts carry everything needs_review() requires.
+
+    Returns (viewer_login, prs).
+    """
+    # gh fills in {owner}/{repo} from the current directory's repository.
+    search = f"repo:{repo or '{owner}/{repo}'} is:pr is:open review-requested:@me"
+    data = await run_gh_json(
+        "api",
+        "graphql",
+        "-f",
+        f"query={REVIEW_REQUESTED_PRS_QUERY}",
+        "-F",
+        f"searchQuery={search}",
+    )
+    if data is None:
+        return None, []
+
+    viewer_login = data["data"]["viewer"]["login"]
+    nodes = data["data"]["search"]["nodes"]
+    return viewer_login, [
+        {
+            "number": node["number"],
+            "url": node["url"],
+            "title": node["title"],
+            "comments": node["comments"]["nodes"],
+            "commits": [c["commit"] for c in node["commits"]["nodes"]],
+        }
+        for node in nodes
+        if node
+    ]
 
 
 async def add_pr_comment(pr_number: int, body: str, repo: str | None = None) -> None:
@@ -57,33 +95,48 @@ async def add_pr_comment(pr_number: int, body: str, repo: str | None = None) ->
     await run_gh_command(*args)
 
 
-def get_last_codex_review_time(comments: list[dict]) -> str | None:
-    """Get the timestamp of the last '@codex review' comment."""
-    last_time = None
-    for comment in comments:
-        if "@codex review" in comment.get("body", ""):
-            created_at = comment.get("createdAt")
-            if created_at and (last_time is None or created_at > last_time):
-                last_time = created_at
-    return last_time
+def get_last_codex_review_time(
+    comments: list[dict], author: str | None = None
+) -> str | None:
+    """Get the timestamp of the last '@codex review' comment.
+
+    If author is given, only comments by that login count. Comments without
+    author info (e.g. deleted users) are still matched on their body.
+    """
+    return max(
+        (
+            comment["createdAt"]
+            for comment in comments
+            # Cheap login check first; a missing author falls through.
+            if (
+                author is None
+                or (comment.get("author") or {}).get("login", author) == author
+            )
+            and "@codex review" in comment.get("body", "")
+            and comment.get("createdAt")
+        ),
+        default=None,
+    )
 
 
 def get_latest_commit_time(commits: list[dict]) -> str | None:
     """Get the timestamp of the latest commit."""
-    latest_time = None
-    for commit in commits:
-        committed_date = commit.get("committedDate")
-        if committed_date and (latest_time is None or committed_date > latest_time):
-            latest_time = committed_date
-    return latest_time
+    return max(
+        (commit["committedDate"] for commit in commits if commit.get("committedDate")),
+        default=None,
+    )
 
 
-def needs_review(comments: list[dict], commits: list[dict]) -> tuple[bool, str]:
+def needs_review(
+    comments: list[dict], commits: list[dict], author: str | None = None
+) -> tuple[bool, str]:
     """Check if PR needs a new '@codex review' comment.
 
+    Only '@codex review' comments by author count when it is given.
+
     Returns (needs_review, reason).
     """
-    last_review = get_last_codex_review_time(comments)
+    last_review = get_last_codex_review_time(comments, author)
     if last_review is None:
         return True, "No '@codex review' comment found"
 
@@ -94,30 +147,8 @@ def needs_review(comments: list[dict], commits: list[dict]) -> tuple[bool, str]:
     return False, "Already reviewed, no new commits"
 
 
-@app.callback(invoke_without_command=True)
-@partial(syncify, raise_sync_error=False)
-async def review(
-    repo: str | None = typer.Option(
-        None,
-        "--repo",
-        "-R",
-        help="Repository in OWNER/REPO format. Uses current repo if not specified.",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without making changes.",
-    ),
-    auto: bool = typer.Option(
-        False,
-        "--auto",
-        "-y",
-        help="Skip confirmation prompts and add comments automatically.",
-    ),
-) -> None:
-    """Find PRs requesting my review and add '@codex review' comment if not present."""
-    prs = await get_review_requested_prs(repo)
+async def _review(repo: str | None, dry_run: bool, auto: bool) -> None:
+    viewer_login, prs = await get_review_requested_prs(repo)
 
     if not prs:
         print("No PRs requesting your review.")
@@ -125,6 +156,8 @@ async def review(
 
     print(f"Found {len(prs)} PR(s) requesting your review:\n")
 
+    pending_comments: list[int] = []
+
     for pr in prs:
         pr_number = pr["number"]
         pr_title = pr["title"]
@@ -133,11 +166,10 @@ async def review(
         print(f"PR #{pr_number}: {pr_title}")
         print(f"  URL: {pr_url}")
 
-        details = await get_pr_details(pr_number, repo)
-        comments = details.get("comments", [])
-        commits = details.get("commits", [])
+        comments = pr.get("comments", [])
+        commits = pr.get("commits", [])
 
-        should_review, reason = needs_review(comments, commits)
+        should_review, reason = needs_review(comments, commits, viewer_login)
         if not should_review:
             print(f"  Status: {reason}, skipping.\n")
         else:
@@ -145,10 +177,60 @@ async def review(
                 print(
                     f"  Status: {reason}. Would add '@codex review' comment (dry-run).\n"
                 )
-            elif auto or typer.confirm(
+            elif auto:
+                pending_comments.append(pr_number)
+                print(f"  Status: {reason}. Adding '@codex review' comment.\n")
+            elif typer.confirm(
                 f"  {reason}. Add '@codex review' comment?", default=True
             ):
                 await add_pr_comment(pr_number, "@codex review", repo)
                 print("  Status: Added '@codex review' comment.\n")
             else:
                 print("  Status: Skipped.\n")
+
+    if not pending_comments:
+        return
+
+    # Post all comments at once; collect failures so one bad PR does not hide
+    # the outcome of the others.
+    results = await asyncio.gather(
+        *(
+            add_pr_comment(pr_number, "@codex review", repo)
+            for pr_number in pending_comments
+        ),
+        return_exceptions=True,
+    )
+    failed = 0
+    for pr_number, result in zip(pending_comments, results):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"PR #{pr_number}: Failed to add '@codex review' comment: {result}")
+    added = len(pending_comments) - failed
+    print(f"Added '@codex review' comment to {added} PR(s).")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.callback(invoke_without_command=True)
+def review(
+    repo: str | None = typer.Option(
+        None,
+        "--repo",
+        "-R",
+        help="Repository in OWNER/REPO format. Uses current repo if not specified.",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would be done without making changes.",
+    ),
+    auto: bool = typer.Option(
+        False,
+        "--auto",
+        "-y",
+        help="Skip confirmation prompts and add comments automatically.",
+    ),
+) -> None:
+    """Find PRs requesting my review and add '@codex review' comment if not present."""
+    runner.run(_review(repo, dry_run, auto))
@@ -1,9 +1,13 @@
 """Streaming message handling for Claude Agent SDK output."""
 
-import json
+from collections.abc import Callable
+from itertools import islice
+from typing import Any
 
+import orjson
 from claude_agent_sdk.types import (
     AssistantMessage,
+    ContentBlock,
     Message,
     ResultMessage,
     SystemMessage,
@@ -16,6 +20,9 @@ from rich.console import Console
 
 console = Console()
 
+# Handlers take (message or block, output, text_end).
+_Handler = Callable[[Any, list[str] | None, str], None]
+
 
 def truncate(text: str, max_length: int = 200) -> str:
     """Truncate text to max_length, adding ellipsis if needed."""
@@ -24,15 +31,122 @@ def truncate(text: str, max_length: int = 200) -> str:
     return text[:max_length] + "..."
 
 
+def clip_for_json(value: Any, max_length: int) -> Any:
+    """Shrink value so serializing it stays bounded by max_length.
+
+    Strings (including dict keys) are cut and containers keep only their
+    leading items, so the first max_length characters of the JSON output are
+    the same as for the full value. Keys that collide once cut only affect
+    output past that point.
+    """
+    if isinstance(value, str):
+        return value[: max_length + 1]
+    if isinstance(value, list):
+        return [clip_for_json(item, max_length) for item in value[: max_length + 1]]
+    if isinstance(value, dict):
+        return {
+            clip_for_json(key, max_length): clip_for_json(item, max_length)
+            for key, item in islice(value.items(), max_length + 1)
+        }
+    return value
+
+
 def format_tool_input(tool_input: dict) -> str:
     """Format tool input for display."""
     try:
-        formatted = json.dumps(tool_input, indent=2, ensure_ascii=False)
-        return truncate(formatted, 500)
+        formatted = orjson.dumps(
+            clip_for_json(tool_input, 500), option=orjson.OPT_INDENT_2
+        )
+        return truncate(formatted.decode(), 500)
     except Exception:
         return truncate(str(tool_input), 500)
 
 
+def format_tool_result(content: str | list[dict[str, Any]]) -> str:
+    """Format tool result content for display."""
+    if isinstance(content, str):
+        return truncate(content, 300)
+    try:
+        formatted = orjson.dumps(clip_for_json(content, 300))
+        return truncate(formatted.decode(), 300)
+    except Exception:
+        return truncate(str(content), 300)
+
+
+def _handle_text(block: TextBlock, output: list[str] | None, text_end: str) -> None:
+    # Model text is plain: skip markup parsing, highlighting and wrapping.
+    console.out(block.text, end=text_end, highlight=False)
+    if output is not None:
+        output.append(block.text)
+
+
+def _handle_thinking(
+    block: ThinkingBlock, output: list[str] | None, text_end: str
+) -> None:
+    console.print(f"[dim italic]💭 {truncate(block.thinking, 300)}[/dim italic]")
+
+
+def _handle_tool_use(
+    block: ToolUseBlock, output: list[str] | None, text_end: str
+) -> None:
+    msg = f"[bold cyan]🔧 {block.name}[/bold cyan]"
+    if block.input:
+        msg += f" [dim]{format_tool_input(block.input)}[/dim]"
+    console.print(msg)
+
+
+def _handle_tool_result(
+    block: ToolResultBlock, output: list[str] | None, text_end: str
+) -> None:
+    if block.content:
+        result_text = format_tool_result(block.content)
+        if block.is_error:
+            console.print(f"[red]❌ {result_text}[/red]")
+        else:
+            console.print(f"[green]✅ {result_text}[/green]")
+
+
+_BLOCK_HANDLERS: dict[type[ContentBlock], _Handler] = {
+    TextBlock: _handle_text,
+    ThinkingBlock: _handle_thinking,
+    ToolUseBlock: _handle_tool_use,
+    ToolResultBlock: _handle_tool_result,
+}
+
+
+def _handle_assistant(
+    message: AssistantMessage, output: list[str] | None, text_end: str
+) -> None:
+    for block in message.content:
+        handler = _BLOCK_HANDLERS.get(type(block))
+        if handler is not None:
+            handler(block, output, text_end)
+
+
+def _handle_system(
+    message: SystemMessage, output: list[str] | None, text_end: str
+) -> None:
+    console.print(
+        f"[yellow]⚙️ [{message.subtype}] {truncate(str(message.data), 200)}[/yellow]"
+    )
+
+
+def _handle_result(
+    message: ResultMessage, output: list[str] | None, text_end: str
+) -> None:
+    if message.result:
+        console.print(f"\n{message.result}")
+        if output is not None:
+            output.append(message.result)
+
+
+_MESSAGE_HANDLERS: dict[type[Message], _Handler] = {
+    AssistantMessage: _handle_assistant,
+    SystemMessage: _handle_system,
+    ResultMessage: _handle_result,
+}
+
+
 def print_message(
     message: Message,
     output: list[str] | None = None,
@@ -40,51 +154,14 @@ def print_message(
 ) -> None:
     """Print a streaming message with rich formatting.
 
+    Handlers are looked up by exact message and block type, so only the
+    types listed in _MESSAGE_HANDLERS and _BLOCK_HANDLERS are printed.
+
     Args:
         message: The message from Claude Agent SDK query stream.
         output: Optional list to collect text output (TextBlock and ResultMessage).
         text_end: End string for TextBlock printing (default: "" for streaming).
     """
-    if isinstance(message, AssistantMessage):
-        for block in message.content:
-            if isinstance(block, TextBlock):
-                console.print(block.text, end=text_end)
-                if output is not None:
-                    output.append(block.text)
-
-            elif isinstance(block, ThinkingBlock):
-                console.print(
-                    f"[dim italic]💭 {truncate(block.thinking, 300)}[/dim italic]"
-                )
-
-            elif isinstance(block, ToolUseBlock):
-                console.print(f"[bold cyan]🔧 {block.name}[/bold cyan]", end="")
-                if block.input:
-                    input_preview = format_tool_input(block.input)
-                    console.print(f" [dim]{input_preview}[/dim]")
-                else:
-                    console.print()
-
-            elif isinstance(block, ToolResultBlock):
-                if block.content:
-                    content_str = (
-                        block.content
-                        if isinstance(block.content, str)
-                        else json.dumps(block.content, ensure_ascii=False)
-                    )
-                    result_text = truncate(content_str, 300)
-                    if block.is_error:
-                        console.print(f"[red]❌ {result_text}[/red]")
-                    else:
-                        console.print(f"[green]✅ {result_text}[/green]")
-
-    elif isinstance(message, SystemMessage):
-        console.print(
-            f"[yellow]⚙️ [{message.subtype}] {truncate(str(message.data), 200)}[/yellow]"
-        )
-
-    elif isinstance(message, ResultMessage):
-        if message.result:
-            console.print(f"\n{message.result}")
-            if output is not None:
-                output.append(message.result)
+    handler = _MESSAGE_HANDLERS.get(type(message))
+    if handler is not None:
+        handler(message, output, text_end)
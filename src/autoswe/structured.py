@@ -5,7 +5,8 @@ This module provides a Pydantic-friendly wrapper that simplifies using
 structured outputs with the Claude Agent SDK.
 """
 
-import dataclasses
+import copy
+import functools
 from typing import TypeVar, AsyncIterator, Any
 from pydantic import BaseModel
 from claude_agent_sdk import query
@@ -15,21 +16,47 @@ from claude_agent_sdk.types import ClaudeAgentOptions, ResultMessage, Message
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=256)
+def _schema_for(schema: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON schema for a model class, generated once per class.
+
+    The dict is shared by every later call and must not be mutated.
+    """
+    return schema.model_json_schema()
+
+
+@functools.lru_cache(maxsize=256)
+def _output_format_for(schema: type[BaseModel]) -> dict[str, Any]:
+    """Return the structured output format for a model class, built once.
+
+    The dict is shared by every later call and must not be mutated; use
+    _merge_options to get a per-call copy.
+    """
+    return {
+        "type": "json_schema",
+        "schema": _schema_for(schema),
+    }
+
+
 def _merge_options(
     options: ClaudeAgentOptions | None,
     schema: type[BaseModel],
 ) -> ClaudeAgentOptions:
-    """Merge user options with structured output format."""
-    output_format = {
-        "type": "json_schema",
-        "schema": schema.model_json_schema(),
-    }
+    """Merge user options with structured output format.
+
+    The returned output_format is a fresh dict, but its "schema" value is the
+    cached schema shared across queries and must not be edited in place.
+    """
+    output_format = dict(_output_format_for(schema))
 
     if options is None:
         return ClaudeAgentOptions(output_format=output_format)
 
-    # Create a new options with output_format set
-    return dataclasses.replace(options, output_format=output_format)
+    # Shallow-copy like dataclasses.replace would, without re-running __init__
+    # over every field; the caller's options are left untouched.
+    merged = copy.copy(options)
+    merged.output_format = output_format
+    return merged
 
 
 async def structured_query(